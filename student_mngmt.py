@@ -12,79 +12,355 @@ Features:
  - Export to PDF (reportlab) and CSV
 """
 
+import bisect
 import csv
+import mmap
 import os
-from typing import List, Dict, Optional
-from io import BytesIO
+import shutil
+import sys
+from array import array
+from operator import itemgetter
+from typing import List, Iterable, Iterator, Optional, Tuple
+from io import StringIO
 
 # Optional PDF export (reportlab). If not installed, export to PDF will show message.
 try:
     from reportlab.lib.pagesizes import A4
-    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+    from reportlab.platypus import SimpleDocTemplate, LongTable, TableStyle, Paragraph, Spacer
     from reportlab.lib import colors
     from reportlab.lib.styles import getSampleStyleSheet
     REPORTLAB_AVAILABLE = True
 except Exception:
     REPORTLAB_AVAILABLE = False
 
+# Optional NumPy for topper/average stats. Falls back to plain Python loops.
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except Exception:
+    NUMPY_AVAILABLE = False
+
 CSV_FILE = "students.csv"
 EXPORT_CSV_FILE = "students_export.csv"
 FIELDNAMES = ["roll", "name", "marks"]
 START_ROLL = 1001
+# Below this many rows NumPy sum/max is already instant, so numba isn't loaded.
+NUMBA_MIN_ROWS = 100_000
+TABLE_HEADER = "{:10} | {:30} | {:6}".format("Roll", "Name", "Marks") + "\n" + "-" * 52
+
+# In-memory copy of students.csv, reused across menu actions until the file changes.
+# Records are kept column-wise (parallel lists) rather than one object per row;
+# Numeric rolls are indexed by "roll_keys", a sorted array("q"), with "roll_rows"
+# holding the matching row positions; "index" maps any non-numeric (stripped)
+# roll to its row position. "search_blob" holds lowercased "roll\x01name" keys,
+# built on first search. "marks_f" is the marks column parsed once to a packed
+# array of doubles.
+_CACHE = {"rolls": None, "names": None, "marks": None, "marks_f": None,
+          "roll_keys": None, "roll_rows": None, "index": None,
+          "mtime": None, "search_blob": None}
+
+Columns = Tuple[List[str], List[str], List[str]]
 
 
 def ensure_file_exists():
     """Create CSV file with header if it doesn't exist."""
     if not os.path.exists(CSV_FILE):
         with open(CSV_FILE, mode="w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
-            writer.writeheader()
+            csv.writer(f).writerow(FIELDNAMES)
+
 
+def _parse_line(line: str) -> Tuple[str, str, str]:
+    """Split one CSV line (without its terminator) into (roll, name, marks).
 
-def load_students() -> List[Dict[str, str]]:
-    """Load all student records from CSV and return as list of dicts."""
+    Lines are split on the first two commas; only lines containing a quote
+    (written by csv.writer for names with commas or quotes) go through csv.reader.
+    Short rows are padded with "" and extra fields are folded into marks, so a
+    malformed line can't break loading.
+    """
+    if '"' in line:
+        fields = next(csv.reader([line]), [])
+    else:
+        fields = line.split(",", 2)
+    if len(fields) < 3:
+        fields += [""] * (3 - len(fields))
+    elif len(fields) > 3:
+        fields[2:] = [",".join(fields[2:])]
+    return fields[0], fields[1], fields[2]
+
+
+def _stream_students() -> Iterator[Tuple[str, str, str]]:
+    """Yield (roll, name, marks) rows straight from the CSV, one at a time."""
     ensure_file_exists()
     with open(CSV_FILE, mode="r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        return [row for row in reader]
-
-
-def save_students(students: List[Dict[str, str]]) -> None:
-    """Overwrite CSV with the provided student records."""
-    with open(CSV_FILE, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
-        writer.writeheader()
-        for s in students:
-            writer.writerow(s)
-
-
-def generate_roll(students: List[Dict[str, str]]) -> str:
-    """Generate next numeric roll (as string). Starts at START_ROLL if empty."""
-    if not students:
-        return str(START_ROLL)
-    # safely convert numeric rolls and pick max; non-numeric rolls are ignored
-    numeric_rolls = []
-    for s in students:
-        r = s.get("roll", "").strip()
-        if r.isdigit():
-            numeric_rolls.append(int(r))
-    if not numeric_rolls:
-        # fallback to count-based
-        return str(START_ROLL + len(students))
-    return str(max(numeric_rolls) + 1)
-
-
-def find_by_roll(students: List[Dict[str, str]], roll: str) -> Optional[Dict[str, str]]:
+        next(f, None)  # header
+        for line in f:
+            line = line.rstrip("\r\n")
+            if line:
+                yield _parse_line(line)
+
+
+def load_students() -> Columns:
+    """Load all student records from CSV as (rolls, names, marks) columns."""
+    rolls, names, marks = [], [], []
+    for roll, name, mark in _stream_students():
+        rolls.append(roll)
+        names.append(name)
+        marks.append(mark)
+    return rolls, names, marks
+
+
+def _marks_value(marks: str) -> float:
+    """Marks as a float; unparsable values count as 0."""
+    try:
+        return float(marks)
+    except Exception:
+        return 0.0
+
+
+def _roll_key(roll: str) -> Optional[int]:
+    """Integer key for a canonical numeric roll that fits the "q" array, else None.
+
+    Rolls like "0101" get None (and go to the string index), so they are never
+    confused with "101".
+    """
     roll = roll.strip()
-    for s in students:
-        if s["roll"].strip() == roll:
-            return s
+    if roll.isdigit() and len(roll) <= 18:
+        key = int(roll)
+        if str(key) == roll:
+            return key
+    return None
+
+
+def _build_roll_index(rolls: List[str]) -> None:
+    """Build the sorted numeric roll index and the dict for non-numeric rolls."""
+    pairs = []
+    other = {}
+    for i, r in enumerate(rolls):
+        key = _roll_key(r)
+        if key is None:
+            other.setdefault(r.strip(), i)  # first of any duplicates wins
+        else:
+            pairs.append((key, i))
+    pairs.sort()
+    _CACHE["roll_keys"] = array("q", [k for k, _ in pairs])
+    _CACHE["roll_rows"] = array("q", [i for _, i in pairs])
+    _CACHE["index"] = other
+
+
+def _csv_mtime() -> int:
+    """Modification time of the CSV in nanoseconds, used to validate the cache."""
+    return os.stat(CSV_FILE).st_mtime_ns
+
+
+def _update_cache(rolls: List[str], names: List[str], marks: List[str]) -> None:
+    """Store columns in the cache with a fresh roll index and the file's mtime."""
+    _CACHE["rolls"] = rolls
+    _CACHE["names"] = names
+    _CACHE["marks"] = marks
+    _CACHE["marks_f"] = array("d", (_marks_value(m) for m in marks))
+    _build_roll_index(rolls)
+    _CACHE["mtime"] = _csv_mtime()
+    _CACHE["search_blob"] = None
+
+
+def get_students() -> Columns:
+    """Return cached (rolls, names, marks), re-reading the CSV only if it changed on disk."""
+    ensure_file_exists()
+    if _CACHE["rolls"] is None or _CACHE["mtime"] != _csv_mtime():
+        _update_cache(*load_students())
+    return _CACHE["rolls"], _CACHE["names"], _CACHE["marks"]
+
+
+def _cache_is_current() -> bool:
+    """True if the cache holds the CSV as it is on disk now."""
+    ensure_file_exists()
+    return _CACHE["rolls"] is not None and _CACHE["mtime"] == _csv_mtime()
+
+
+def iter_students() -> Iterator[Tuple[str, str, str]]:
+    """Iterate (roll, name, marks) from the cache if it is current, else stream from the CSV."""
+    if _cache_is_current():
+        return zip(_CACHE["rolls"], _CACHE["names"], _CACHE["marks"])
+    return _stream_students()
+
+
+def _search_key(roll: str, name: str) -> str:
+    """Lowercased roll and name joined by a separator a query can't contain."""
+    return (roll + "\x01" + name).lower()
+
+
+def get_search_blob() -> List[str]:
+    """Return the per-row search keys, building them once per cache load."""
+    rolls, names, _ = get_students()
+    if _CACHE["search_blob"] is None:
+        _CACHE["search_blob"] = [_search_key(r, n) for r, n in zip(rolls, names)]
+    return _CACHE["search_blob"]
+
+
+def _csv_text(rolls: List[str], names: List[str], marks: List[str]) -> str:
+    """Render header and rows to CSV text in memory, so the file gets one write."""
+    buf = StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(FIELDNAMES)
+    writer.writerows(zip(rolls, names, marks))
+    return buf.getvalue()
+
+
+def _write_csv(rolls: List[str], names: List[str], marks: List[str]) -> None:
+    """Overwrite CSV with the provided columns.
+
+    Writes to a temporary sibling file and swaps it in with os.replace, so an
+    interrupted save leaves the previous CSV intact instead of a truncated one.
+    """
+    payload = _csv_text(rolls, names, marks)
+    tmp = CSV_FILE + ".tmp"
+    try:
+        with open(tmp, mode="w", newline="", encoding="utf-8") as f:
+            f.write(payload)
+        if os.path.exists(CSV_FILE):
+            shutil.copymode(CSV_FILE, tmp)  # keep the original file's permissions
+        os.replace(tmp, CSV_FILE)
+    except BaseException:
+        # don't leave a half-written temp file behind (e.g. on Ctrl-C)
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _unindex_row(roll: str, i: int) -> None:
+    """Drop row i from the roll indexes and shift later row positions down by one.
+
+    Called after row i has been removed from the columns.
+    """
+    roll_keys, roll_rows, index = _CACHE["roll_keys"], _CACHE["roll_rows"], _CACHE["index"]
+    key = _roll_key(roll)
+    repoint = False
+    if key is None:
+        if index.get(roll.strip()) == i:
+            del index[roll.strip()]
+            repoint = True
+    else:
+        j = bisect.bisect_left(roll_keys, key)
+        while roll_rows[j] != i:  # duplicate rolls: find this row's entry
+            j += 1
+        del roll_keys[j]
+        del roll_rows[j]
+    for j, r in enumerate(roll_rows):
+        if r > i:
+            roll_rows[j] = r - 1
+    for k, r in index.items():
+        if r > i:
+            index[k] = r - 1
+    if repoint:
+        # a later row with the same roll becomes the indexed (first) one
+        rolls, stripped = _CACHE["rolls"], roll.strip()
+        for j in range(i, len(rolls)):
+            if rolls[j].strip() == stripped:
+                index[stripped] = j
+                break
+
+
+def update_student(i: int, name: str, marks: str) -> None:
+    """Change name and marks of the record at row position i in the cache (in place) and the CSV."""
+    rolls, names, marks_col = get_students()
+    names[i] = name
+    marks_col[i] = marks
+    _CACHE["marks_f"][i] = _marks_value(marks)
+    if _CACHE["search_blob"] is not None:
+        _CACHE["search_blob"][i] = _search_key(rolls[i], name)
+    _write_csv(rolls, names, marks_col)
+    _CACHE["mtime"] = _csv_mtime()
+
+
+def remove_student(i: int) -> None:
+    """Delete the record at row position i from the cache (in place) and the CSV."""
+    rolls, names, marks = get_students()
+    roll = rolls[i]
+    for column in (rolls, names, marks, _CACHE["marks_f"]):
+        del column[i]
+    if _CACHE["search_blob"] is not None:
+        del _CACHE["search_blob"][i]
+    _unindex_row(roll, i)
+    _write_csv(rolls, names, marks)
+    _CACHE["mtime"] = _csv_mtime()
+
+
+def _prepare_for_append() -> None:
+    """Make sure an appended row starts a new data line.
+
+    An empty (0-byte) CSV gets its header written first; a last line without a
+    terminator (e.g. after a hand edit) gets one.
+    """
+    with open(CSV_FILE, mode="rb+") as f:
+        if f.seek(0, os.SEEK_END) == 0:
+            f.write((",".join(FIELDNAMES) + "\r\n").encode("utf-8"))
+            return
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b"\n":
+            f.write(b"\r\n")
+
+
+def append_student(roll: str, name: str, marks: str) -> None:
+    """Append a single record to the end of the CSV instead of rewriting it."""
+    rolls, names, marks_col = get_students()
+    _prepare_for_append()
+    with open(CSV_FILE, mode="a", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerow((roll, name, marks))
+    key = _roll_key(roll)
+    if key is None:
+        _CACHE["index"].setdefault(roll.strip(), len(rolls))
+    else:
+        pos = bisect.bisect_right(_CACHE["roll_keys"], key)
+        _CACHE["roll_keys"].insert(pos, key)
+        _CACHE["roll_rows"].insert(pos, len(rolls))
+    rolls.append(roll)
+    names.append(name)
+    marks_col.append(marks)
+    _CACHE["marks_f"].append(_marks_value(marks))
+    if _CACHE["search_blob"] is not None:
+        _CACHE["search_blob"].append(_search_key(roll, name))
+    _CACHE["mtime"] = _csv_mtime()
+
+
+def generate_roll() -> str:
+    """Next roll (as string): one past the highest numeric roll. Starts at START_ROLL if empty."""
+    rolls, _, _ = get_students()
+    roll_keys = _CACHE["roll_keys"]
+    if not roll_keys:
+        # no numeric rolls: fallback to count-based
+        return str(START_ROLL + len(rolls))
+    return str(roll_keys[-1] + 1)
+
+
+def find_by_roll(roll: str) -> Optional[int]:
+    """Row position of the student with this roll, or None."""
+    get_students()
+    key = _roll_key(roll)
+    if key is None:
+        return _CACHE["index"].get(roll.strip())
+    roll_keys = _CACHE["roll_keys"]
+    i = bisect.bisect_left(roll_keys, key)
+    if i < len(roll_keys) and roll_keys[i] == key:
+        return _CACHE["roll_rows"][i]
     return None
 
 
+def _valid_marks(text: str) -> Optional[float]:
+    """Parse marks typed as plain digits with at most one decimal point.
+
+    Returns the value if it is within 0-100, else None. The format is checked
+    with str methods first, so invalid input never reaches float() and no
+    exception is raised.
+    """
+    digits = text.replace(".", "", 1)
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    value = float(text)
+    return value if value <= 100 else None
+
+
 def add_student():
-    students = load_students()
-    roll = generate_roll(students)
+    roll = generate_roll()
     print(f"\nGenerated Roll Number: {roll}")
 
     name = input("Enter Name: ").strip()
@@ -93,164 +369,224 @@ def add_student():
         return
 
     marks_input = input("Enter Marks (0-100): ").strip()
-    try:
-        # calculate digit-by-digit check: parse safely
-        marks = float(marks_input)
-        if marks < 0 or marks > 100:
-            raise ValueError()
-        marks_str = str(int(marks)) if marks.is_integer() else str(marks)
-    except Exception:
+    marks = _valid_marks(marks_input)
+    if marks is None:
         print("Invalid marks. Please use a number between 0 and 100. Aborting add.")
         return
+    marks_str = str(int(marks)) if marks.is_integer() else str(marks)
 
-    students.append({"roll": roll, "name": name, "marks": marks_str})
-    save_students(students)
+    append_student(roll, name, marks_str)
     print(f"Student added successfully with Roll {roll}.")
 
 
 def delete_student():
-    students = load_students()
+    rolls, names, marks = get_students()
     roll = input("Enter Roll Number to delete: ").strip()
     if not roll:
         print("Empty roll. Aborting delete.")
         return
-    found = find_by_roll(students, roll)
-    if not found:
+    i = find_by_roll(roll)
+    if i is None:
         print(f"No student found with roll '{roll}'.")
         return
 
-    confirm = input(f"Are you sure you want to delete {found['name']} (roll {roll})? [y/N]: ").strip().lower()
+    confirm = input(f"Are you sure you want to delete {names[i]} (roll {roll})? [y/N]: ").strip().lower()
     if confirm != "y":
         print("Delete cancelled.")
         return
 
-    students = [s for s in students if s["roll"].strip() != roll]
-    save_students(students)
+    remove_student(i)
     print("Student deleted and changes saved.")
 
 
+def _write_rows(rows: Iterable[Tuple[str, str, str]]) -> None:
+    """Print (roll, name, marks) rows as table lines with a single write."""
+    lines = [f"{roll:<10} | {name:<30} | {marks:<6}" for roll, name, marks in rows]
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _mmap_search(query: str) -> List[Tuple[str, str, str]]:
+    """Search the CSV bytes directly, parsing only lines that contain the query.
+
+    query must be lowercase ASCII with no double quote. The file is memory-mapped and lowercased in
+    one go; bytes.find jumps between candidate lines, and each candidate is then
+    parsed and re-checked against roll/name only (the raw line also holds marks).
+    """
+    if os.path.getsize(CSV_FILE) == 0:
+        return []
+    q = query.encode("ascii")
+    results = []
+    with open(CSV_FILE, mode="rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        data = mm[:].lower()
+        header_end = data.find(b"\n") + 1
+        if not header_end:
+            return []
+        pos = data.find(q, header_end)
+        while pos != -1:
+            start = data.rfind(b"\n", 0, pos) + 1
+            end = data.find(b"\n", pos)
+            if end == -1:
+                end = len(data)
+            row = _parse_line(mm[start:end].decode("utf-8").rstrip("\r"))
+            if query in row[0].lower() or query in row[1].lower():
+                results.append(row)
+            pos = data.find(q, end + 1)
+    return results
+
+
 def search_student():
-    students = load_students()
     query = input("Search by Roll or Name (partial allowed): ").strip().lower()
     if not query:
         print("Empty query. Aborting search.")
         return
-    results = []
-    for s in students:
-        if query in s["roll"].lower() or query in s["name"].lower():
-            results.append(s)
+    if not _cache_is_current() and query.isascii() and '"' not in query:
+        # nothing loaded yet: scan the file bytes instead of parsing every row
+        # (a quote is stored escaped as "" in the file, so those queries can't)
+        results = _mmap_search(query)
+    else:
+        rolls, names, marks = get_students()
+        # one substring test per row against the precomputed lowercase key
+        results = [(rolls[i], names[i], marks[i])
+                   for i, key in enumerate(get_search_blob()) if query in key]
 
     if not results:
         print("No matching student records found.")
         return
 
     print(f"\nFound {len(results)} result(s):")
-    print("{:10} | {:30} | {:6}".format("Roll", "Name", "Marks"))
-    print("-" * 52)
-    for r in results:
-        print("{:10} | {:30} | {:6}".format(r["roll"], r["name"], r["marks"]))
+    print(TABLE_HEADER)
+    _write_rows(results)
     print()
 
 
 def list_students(show_header: bool = True):
-    students = load_students()
-    if not students:
+    rolls, names, marks = get_students()
+    if not rolls:
         print("No student records yet.")
         return
-    # try numeric sort
-    try:
-        students.sort(key=lambda x: int(x["roll"]))
-    except Exception:
-        students.sort(key=lambda x: x["roll"])
+    # numeric sort on rolls parsed once (non-numeric rolls first); sorts row
+    # positions, so the cached order is left alone
+    decorated = [(int(r) if r.strip().isdigit() else -1, i) for i, r in enumerate(rolls)]
+    decorated.sort(key=itemgetter(0))
+    order = [d[1] for d in decorated]
 
     if show_header:
-        print("{:10} | {:30} | {:6}".format("Roll", "Name", "Marks"))
-        print("-" * 52)
-    for s in students:
-        print("{:10} | {:30} | {:6}".format(s["roll"], s["name"], s["marks"]))
-    print(f"\nTotal students: {len(students)}\n")
+        print(TABLE_HEADER)
+    _write_rows((rolls[i], names[i], marks[i]) for i in order)
+    print(f"\nTotal students: {len(rolls)}\n")
 
 
 def edit_student():
-    students = load_students()
+    rolls, names, marks = get_students()
     roll = input("Enter Roll Number to edit: ").strip()
     if not roll:
         print("Empty roll. Aborting edit.")
         return
-    student = find_by_roll(students, roll)
-    if not student:
+    i = find_by_roll(roll)
+    if i is None:
         print(f"No student found with roll '{roll}'.")
         return
 
-    print(f"Editing {student['name']} (Roll {student['roll']})")
-    new_name = input(f"Enter new name [{student['name']}] (press Enter to keep): ").strip()
+    print(f"Editing {names[i]} (Roll {rolls[i]})")
+    new_name = input(f"Enter new name [{names[i]}] (press Enter to keep): ").strip()
     if not new_name:
-        new_name = student["name"]
+        new_name = names[i]
 
-    new_marks_input = input(f"Enter new marks [{student['marks']}] (press Enter to keep): ").strip()
+    new_marks_input = input(f"Enter new marks [{marks[i]}] (press Enter to keep): ").strip()
     if not new_marks_input:
-        new_marks_str = student["marks"]
+        new_marks_str = marks[i]
     else:
-        try:
-            new_marks = float(new_marks_input)
-            if new_marks < 0 or new_marks > 100:
-                raise ValueError()
-            new_marks_str = str(int(new_marks)) if new_marks.is_integer() else str(new_marks)
-        except Exception:
+        new_marks = _valid_marks(new_marks_input)
+        if new_marks is None:
             print("Invalid marks. Aborting edit.")
             return
+        new_marks_str = str(int(new_marks)) if new_marks.is_integer() else str(new_marks)
 
-    # apply update
-    for s in students:
-        if s["roll"].strip() == roll:
-            s["name"] = new_name
-            s["marks"] = new_marks_str
-            break
-    save_students(students)
+    update_student(i, new_name, new_marks_str)
     print("Student updated and saved.")
 
 
+def _marks_stats(marks):
+    """Total and maximum of a non-empty float64 marks array in a single pass."""
+    total = 0.0
+    max_marks = marks[0]
+    for v in marks:
+        total += v
+        if v > max_marks:
+            max_marks = v
+    return total, max_marks
+
+
+# Optional Numba JIT for _marks_stats, imported lazily on first large topper run
+# so it doesn't slow down every CLI start.
+_NUMBA = {"checked": False, "marks_stats": None}
+
+
+def _jit_marks_stats():
+    """Numba-compiled _marks_stats, or None if numba isn't installed."""
+    if not _NUMBA["checked"]:
+        _NUMBA["checked"] = True
+        try:
+            from numba import njit
+            # compiled once, then reused from the on-disk cache in later sessions
+            _NUMBA["marks_stats"] = njit(cache=True)(_marks_stats)
+        except Exception:
+            pass
+    return _NUMBA["marks_stats"]
+
+
 def topper_and_average():
-    students = load_students()
-    if not students:
+    rolls, names, marks_col = get_students()
+    marks_f = _CACHE["marks_f"]
+    count = len(marks_f)
+    if not count:
         print("No records to calculate topper/average.")
         return
 
-    marks_list = []
-    for s in students:
-        try:
-            marks_list.append(float(s["marks"]))
-        except Exception:
-            marks_list.append(0.0)
+    if NUMPY_AVAILABLE:
+        # zero-copy view over the cached array("d") of parsed marks
+        marks = np.frombuffer(marks_f, dtype=np.float64)
+        jit_stats = _jit_marks_stats() if count >= NUMBA_MIN_ROWS else None
+        if jit_stats is not None:
+            total, max_marks = jit_stats(marks)
+        else:
+            total, max_marks = marks.sum(), marks.max()
+        total, max_marks = float(total), float(max_marks)
+        top_rows = np.flatnonzero(marks == max_marks)
+        del marks  # release the buffer export so the array can grow again
+    else:
+        total = sum(marks_f)
+        max_marks = max(marks_f)
+        top_rows = [i for i, m in enumerate(marks_f) if m == max_marks]
+    toppers = [(rolls[i], names[i], marks_col[i]) for i in top_rows]
 
-    # average (computed step by step)
-    total = 0.0
-    for m in marks_list:
-        total += m
-    avg = total / len(marks_list)
+    avg = total / count
     # round to 2 decimal places
     avg_rounded = round(avg, 2)
 
-    max_marks = max(marks_list)
-    toppers = [s for s in students if float(s.get("marks", 0)) == max_marks]
-
     print(f"\nAverage Marks: {avg_rounded}")
     print(f"Top Marks: {max_marks}")
     print("Topper(s):")
-    for t in toppers:
-        print(f" - {t['name']} (Roll {t['roll']}) — {t['marks']}")
+    for roll, name, marks in toppers:
+        print(f" - {name} (Roll {roll}) — {marks}")
     print()
 
 
+def _has_records() -> bool:
+    """True if the CSV has at least one data row after the header."""
+    ensure_file_exists()
+    with open(CSV_FILE, mode="r", newline="", encoding="utf-8") as f:
+        next(f, None)  # header
+        return any(line.strip() for line in f)
+
+
 def export_csv():
-    students = load_students()
-    if not students:
+    if not _has_records():
         print("No records to export.")
         return
-    with open(EXPORT_CSV_FILE, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
-        writer.writeheader()
-        writer.writerows(students)
+    # same schema, no transformation: copy the file as-is (sendfile on Linux)
+    shutil.copyfile(CSV_FILE, EXPORT_CSV_FILE)
     print(f"Exported to CSV file: {EXPORT_CSV_FILE}")
 
 
@@ -259,10 +595,10 @@ def export_pdf():
         print("reportlab is not installed. Install it with: pip install reportlab")
         return
 
-    students = load_students()
+    # rows go straight from iter_students() into the table data; reportlab
+    # needs a sequence here, so this is the only copy of the rows
     data = [["Roll", "Name", "Marks"]]
-    for s in students:
-        data.append([s["roll"], s["name"], s["marks"]])
+    data.extend(iter_students())
 
     filename = "students_report.pdf"
     doc = SimpleDocTemplate(filename, pagesize=A4)
@@ -270,10 +606,11 @@ def export_pdf():
     elems = []
     elems.append(Paragraph("Student Management System - Report", styles["Title"]))
     elems.append(Spacer(1, 12))
-    elems.append(Paragraph(f"Total students: {len(students)}", styles["Normal"]))
+    elems.append(Paragraph(f"Total students: {len(data) - 1}", styles["Normal"]))
     elems.append(Spacer(1, 12))
 
-    table = Table(data, colWidths=[60, 300, 60])
+    # LongTable lays out page by page; repeatRows=1 repeats the header on each page
+    table = LongTable(data, colWidths=[60, 300, 60], repeatRows=1)
     table.setStyle(TableStyle([
         ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#4B8BBE")),
         ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),